@@ -1,28 +1,70 @@
 import os
 import sys
 import json
+import shutil
 import argparse
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
 from io import BytesIO
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
 from PIL import Image
 
-from steam.steam import (
-    SteamEnvironment,
-    SteamUserManager,
-    SteamAppLibrary,
-    SteamAssetManager,
-)
-import epic.epic as epic
+from library_cache.library_cache import input_signature, library_lock, load_cached_library, save_cached_library
 from environment.environment import find_environment_installs, EnvironmentAppsJSON
 
+# Inputs that cancel an interactive selection prompt
+_EXIT_TOKENS = frozenset(("", "q", "quit", "exit"))
+
+# Magic bytes every PNG file starts with
+_PNG_SIG = b"\x89PNG\r\n\x1a\n"
+
+# Concurrent cover downloads when restoring managed covers
+_COVER_DOWNLOAD_WORKERS = 8
+
 
 # =====================================================================
 #                           Helper Functions
 # =====================================================================
+@lru_cache(maxsize=1)
+def _helios_dir() -> Path:
+    """
+    %LOCALAPPDATA%\\Helios, where the cache and covers live. Resolved on
+    first use so commands like --help still work without LOCALAPPDATA.
+    """
+    local_appdata = os.getenv("LOCALAPPDATA")
+    if not local_appdata:
+        print("LOCALAPPDATA is not set; Helios cannot locate its data folder.")
+        sys.exit(1)
+    return Path(local_appdata) / "Helios"
+
+
+def _covers_dir() -> Path:
+    """
+    Folder holding the processed PNG covers.
+    """
+    return _helios_dir() / "covers"
+
+
+def _cache_file() -> Path:
+    """
+    Helios app cache (apps.json).
+    """
+    return _helios_dir() / "apps.json"
+
+
+def _cache_sig_file() -> Path:
+    """
+    Input mtimes recorded after the last full cache rebuild.
+    """
+    return _helios_dir() / "apps.json.sig"
+
+
 def dry_run_print(dry_run: bool, message: str):
     if dry_run:
         print(f"[DRY RUN] {message}")
@@ -31,26 +73,91 @@ def is_valid_png(path: Path) -> bool:
     """
     Validates that a file at a specific path is a valid PNG image.
     Used to ensure cover art integrity.
+    Only the 8-byte PNG signature is read; the image is not decoded.
     """
     try:
-        with Image.open(path) as im:
-            return im.format == "PNG"
-    except Exception:
+        with open(path, "rb") as f:
+            return f.read(8) == _PNG_SIG
+    except OSError:
         return False
 
 
+def _is_http_url(value: str) -> bool:
+    """
+    Cheap scheme check for http(s) URLs (no full urlparse).
+    """
+    return value[:8].lower().startswith(("http://", "https://"))
+
+
 def parse_uuid_args(arg_list):
     """
     Parse CLI arguments that may contain comma‑separated UUIDs.
     Accepts formats like:
         ["uuid1,uuid2"]
         ["uuid1, uuid2"]
-    Returns a flat list of UUID strings.
+    Returns a flat list of unique UUID strings, in the order given.
     """
     uuids = []
     for part in arg_list or []:
         uuids.extend(u.strip() for u in part.split(",") if u.strip())
-    return uuids
+    return list(dict.fromkeys(uuids))
+
+
+def _clean_int(token: str) -> int | None:
+    """
+    Convert a 1-based selection token (e.g. " 3") into a 0-based index.
+    Returns None for non-numeric tokens.
+    """
+    token = token.strip()
+    # isdecimal, not isdigit: "²".isdigit() is True but int("²") raises
+    return int(token) - 1 if token.isdecimal() else None
+
+
+def _parse_selection(selection: str, count: int) -> list[int]:
+    """
+    Turn "3, 1,3,x" into valid 0-based indices [2, 0], keeping the order
+    the user typed them in and dropping duplicates.
+    """
+    return [
+        i for i in dict.fromkeys(_clean_int(x) for x in selection.split(","))
+        if i is not None and 0 <= i < count
+    ]
+
+
+def _normalize_name(text: str) -> str:
+    """
+    Search key for a name or search term: NFKD-decomposed, combining marks
+    dropped and casefolded, so "Pokémon" matches "POKEMON".
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def _index_by_name(all_libraries: dict) -> list[tuple[str, str, dict]]:
+    """
+    Build a (uuid, normalized name, app) index so repeated fuzzy searches
+    do not normalize every app name once per search term.
+    """
+    return [
+        (uuid, _normalize_name(app.get("name", "")), app)
+        for uuid, app in all_libraries.items()
+    ]
+
+
+def _match_names(name_index: list[tuple[str, str, dict]], terms_l: list[str]) -> list[dict]:
+    """
+    Single pass over a name index, returning every app whose normalized
+    name contains at least one of the (already normalized) terms.
+    """
+    if not terms_l:
+        return []
+    if len(terms_l) == 1:
+        term_l = terms_l[0]
+        return [a for _, name_l, a in name_index if term_l in name_l]
+    return [
+        a for _, name_l, a in name_index
+        if any(term_l in name_l for term_l in terms_l)
+    ]
 
 
 def resolve_apps_by_input(all_libraries: dict, input_str: str) -> list[dict]:
@@ -64,23 +171,29 @@ def resolve_apps_by_input(all_libraries: dict, input_str: str) -> list[dict]:
     """
     search_terms = [s.strip() for s in input_str.split(",") if s.strip()]
     matches: list[dict] = []
+    fuzzy_terms: list[str] = []
 
     for term in search_terms:
         # First try exact UUID match
         app = all_libraries.get(term)
         if app:
             matches.append(app)
-            continue
+        else:
+            fuzzy_terms.append(_normalize_name(term))
 
-        # Otherwise perform fuzzy name matching
-        term_l = term.lower()
-        matches.extend(
-            a for a in all_libraries.values()
-            if term_l in a.get("name", "").lower()
-        )
+    # Otherwise perform fuzzy name matching (one pass for all terms)
+    if fuzzy_terms:
+        matches.extend(_match_names(_index_by_name(all_libraries), fuzzy_terms))
 
-    # Deduplicate by UUID to avoid duplicates in output
-    return list({a["uuid"]: a for a in matches}.values())
+    # Deduplicate by UUID to avoid duplicates in output (first appearance wins)
+    seen: set[str] = set()
+    unique: list[dict] = []
+    for a in matches:
+        uuid = a["uuid"]
+        if uuid not in seen:
+            seen.add(uuid)
+            unique.append(a)
+    return unique
 
 
 def check_admin_write(file_path: Path) -> bool:
@@ -105,7 +218,7 @@ def verify_helios_covers_dir(verbose: bool = False, dry_run: bool = False) -> No
     Ensure Helios covers directory exists in LocalAppData.
     This is where processed PNGs are stored.
     """
-    covers_dir = Path(os.getenv("LOCALAPPDATA")) / "Helios" / "covers"
+    covers_dir = _covers_dir()
     if not covers_dir.exists():
         if dry_run:
             dry_run_print(dry_run, f"Would create covers directory {covers_dir}")
@@ -115,27 +228,78 @@ def verify_helios_covers_dir(verbose: bool = False, dry_run: bool = False) -> No
                 print(f"Created Helios covers directory at {covers_dir}")
 
 
-def get_steam_library() -> dict:
+@lru_cache(maxsize=None)
+def _cached_installs(environment: str = "all") -> tuple[dict, ...]:
+    """
+    Per-process cache of find_environment_installs().
+    Installed environments do not change during a single Helios run.
+    """
+    return tuple(find_environment_installs(environment))
+
+
+def get_steam_library(dry_run: bool = False) -> tuple[dict, list[str]]:
     """
     Fetches installed Steam games and added Non-Steam shortcuts.
     Normalizes them into a standard dictionary format.
+    Returns the library and the input files it was built from.
+    A dry run reads the on-disk library cache but never writes it.
     """
+    # Imported lazily so commands that never touch Steam skip vdf/appinfo
+    from steam.steam import SteamEnvironment, SteamUserManager
+
     env = SteamEnvironment()
     user_mgr = SteamUserManager(env)
-    app_lib = SteamAppLibrary(env)
-    asset_mgr = SteamAssetManager(env)
 
     # Get the active Steam user to find specific shortcuts
     users = user_mgr.get_users()
     steam_user = next(iter(users.values()))
 
+    # Reuse the last build while no manifest, shortcut or asset folder changed
+    cache_path = _helios_dir() / "steam_library.pkl"
+    inputs = env.library_inputs(steam_user)
+    cached = load_cached_library(inputs, cache_path)
+    if cached is not None:
+        return cached, inputs
+
+    if dry_run:
+        return _build_steam_library(env, steam_user), inputs
+
+    # One rebuild at a time; a run that waited here reuses the fresh pickle
+    with library_lock(cache_path):
+        cached = load_cached_library(inputs, cache_path)
+        if cached is not None:
+            return cached, inputs
+
+        merged_apps = _build_steam_library(env, steam_user)
+        save_cached_library(inputs, cache_path, merged_apps)
+    return merged_apps, inputs
+
+
+def _build_steam_library(env, steam_user) -> dict:
+    """
+    Parse appinfo, manifests, shortcuts and assets into the merged Steam library.
+    """
+    from steam.steam import SteamAppLibrary, SteamAssetManager
+
+    app_lib = SteamAppLibrary(env)
+    asset_mgr = SteamAssetManager(env)
+
     installed_steam_apps = app_lib.get_installed_steam_apps()
     nonsteam_apps = app_lib.get_nonsteam_apps(steam_user)
 
+    # Look up every app's assets in one batch per source
+    steam_assets = asset_mgr.get_all_steam_assets(
+        [int(a["appID"]) for a in installed_steam_apps.values() if a.get("appID")]
+    )
+    nonsteam_assets = asset_mgr.get_all_nonsteam_assets(
+        [a["appID"] for a in nonsteam_apps.values() if a.get("appID")],
+        steam_user,
+    )
+
     # Add library_capsule (cover art) path for native Steam apps
     for app in installed_steam_apps.values():
         app_id = app.get("appID")
-        assets = asset_mgr.get_steam_assets(int(app_id)) if app_id else {}
+        assets = steam_assets.get(int(app_id), {}) if app_id else {}
         for asset_name, asset_value in assets.items():
             if asset_value:
                 app[asset_name] = str(Path(asset_value))
@@ -144,7 +308,7 @@ def get_steam_library() -> dict:
     # Add library_capsule for non-Steam shortcuts added to Steam
     for app in nonsteam_apps.values():
         app_id = app.get("appID")
-        assets = asset_mgr.get_nonsteam_assets(app_id, steam_user) if app_id else {}
+        assets = nonsteam_assets.get(app_id, {}) if app_id else {}
         for asset_name, asset_value in assets.items():
             if asset_value:
                 app[asset_name] = str(Path(asset_value))
@@ -155,25 +319,42 @@ def get_steam_library() -> dict:
     return merged_apps
 
 
-def get_installed_epic_games() -> dict:
+def get_installed_epic_games(dry_run: bool = False) -> tuple[dict, list[str]]:
     """
     Fetches installed Epic Games Store apps using the Manifests and Catalog Cache.
+    Returns the library and the input files it was built from.
+    A dry run reads the on-disk library cache but never writes it.
     """
+    import epic.epic as epic
+
     MANIFESTS = Path(r"C:\ProgramData\Epic\EpicGamesLauncher\Data\Manifests")
     CATCACHE_BIN = Path(r"C:\ProgramData\Epic\EpicGamesLauncher\Data\Catalog\catcache.bin")
+
+    cache_path = _helios_dir() / "epic_library.pkl"
+    inputs = [str(MANIFESTS), str(CATCACHE_BIN)]
+    if MANIFESTS.is_dir():
+        inputs += [str(p) for p in MANIFESTS.glob("*.item")]
+    cached = load_cached_library(inputs, cache_path)
+    if cached is not None:
+        return cached, inputs
+
     epic_lib = epic.EpicLibrary(MANIFESTS, CATCACHE_BIN)
 
     epic_apps: dict[str, dict] = {}
     for app in epic_lib.games():
         epic_apps[app.uuid] = app.to_app_dict()
-    return epic_apps
+    if not dry_run:
+        save_cached_library(inputs, cache_path, epic_apps)
+    return epic_apps, inputs
 
 
+@lru_cache(maxsize=None)
 def get_environment_apps(preferred: tuple[str, ...] = ("Apollo", "Sunshine")) -> EnvironmentAppsJSON:
     """
     Loads the apps.json for the first available environment in preferred order.
+    Cached so every caller in a run shares one EnvironmentAppsJSON instance.
     """
-    installs = find_environment_installs("all")
+    installs = _cached_installs("all")
     if not installs:
         print("No supported environment installation found.")
         sys.exit(1)
@@ -209,7 +390,7 @@ def print_library_info(
 
     # ------------------------ Sunshine/Apollo environment ------------------------
     if library_name in ("apollo", "sunshine"):
-        installs = find_environment_installs(library_name)
+        installs = _cached_installs(library_name)
         install = installs[0] if installs else None
 
         if not install:
@@ -247,15 +428,9 @@ def print_library_info(
             print("Steam library not loaded.")
             return
 
-        steam_count = 0
-        nonsteam_count = 0
-
-        for app in steam_apps.values():
-            src = app.get("source")
-            if src == "steam":
-                steam_count += 1
-            elif src == "nonsteam":
-                nonsteam_count += 1
+        source_counts = Counter(app.get("source") for app in steam_apps.values())
+        steam_count = source_counts["steam"]
+        nonsteam_count = source_counts["nonsteam"]
 
         print_line()
         print(f"{library_name.capitalize()} Library Info".center(50))
@@ -316,34 +491,56 @@ def mark_helios_managed_apps(library: dict, environment: EnvironmentAppsJSON, dr
     inside the active environment (Apollo/Sunshine/etc.).
     Adds a 'managed_by_helios' boolean flag to the app dictionary.
     """
+    env_uuids = environment.by_uuid.keys()
     for app_uuid, app_data in library.items():
         if dry_run:
             dry_run_print(dry_run, f"Would update managed state of {app_data['name']} ({app_data['uuid']})")
         else:
-            app_data["managed_by_helios"] = bool(environment.get_app_by_uuid(app_uuid))
+            app_data["managed_by_helios"] = app_uuid in env_uuids
     return library
 
 
-def update_helios_cache(libraries: dict, selection: str, verbose: bool = False, dry_run: bool = False) -> None:
+def update_helios_cache(
+    libraries: dict,
+    selection: str | list[str],
+    verbose: bool = False,
+    dry_run: bool = False,
+) -> None:
     """
     Maintains a local JSON cache of discovered apps in LocalAppData/Helios.
     Speeds up future operations by not needing to re-parse massive library
     files every time.
+
+    `selection` is either a source ("steam", "nonsteam", "epic", "all") or a
+    list of UUIDs whose entries are merged into the existing cache in place.
     """
+    cache_file = _cache_file()
+    sig_file = _cache_sig_file()
+
+    if not isinstance(selection, str):
+        selection_label = f"{len(selection)} changed apps"
+    else:
+        selection_label = selection
+
     if dry_run:
-        dry_run_print(dry_run, f"Would update Helios cache for {selection}")
+        dry_run_print(dry_run, f"Would update Helios cache for {selection_label}")
         return
 
-    HELIOS_CACHE_FILE = Path(os.getenv("LOCALAPPDATA")) / "Helios" / "apps.json"
-    HELIOS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
 
-    if HELIOS_CACHE_FILE.exists():
-        with open(HELIOS_CACHE_FILE, "r", encoding="utf-8") as f:
+    if cache_file.exists():
+        with open(cache_file, "r", encoding="utf-8") as f:
             current_cache = json.load(f)
     else:
         current_cache = {}
 
-    if selection == "steam":
+    if not isinstance(selection, str):
+        # Incremental update: only the given UUIDs are refreshed
+        apps_to_include = {
+            uuid: libraries[uuid] for uuid in selection
+            if uuid in libraries
+        }
+    elif selection == "steam":
         apps_to_include = {
             k: v for k, v in libraries.items()
             if v.get("source") == "steam"
@@ -363,32 +560,78 @@ def update_helios_cache(libraries: dict, selection: str, verbose: bool = False,
 
     if selection == "all":
         current_cache.clear()
-    else:
+    elif isinstance(selection, str):
         # Clear only the selected source from cache before rebuilding
         for uuid, app_data in list(current_cache.items()):
             if app_data.get("source") == selection:
                 current_cache.pop(uuid)
 
-    # Merge new apps into cache
+    # Merge new apps into cache (in place; old metadata survives unless overwritten)
     for uuid, app_data in apps_to_include.items():
-        old_metadata = current_cache.get(uuid, {})
-        current_cache[uuid] = {**old_metadata, **app_data}
+        slot = current_cache.get(uuid)
+        if slot is None:
+            current_cache[uuid] = dict(app_data)
+        else:
+            slot.update(app_data)
+
+    # Compact output keeps json on its C encoder; write-then-rename so a
+    # concurrent or interrupted run never leaves a half-written cache behind
+    tmp_file = cache_file.with_suffix(".json.tmp")
+    tmp_file.write_text(json.dumps(current_cache, separators=(",", ":")), encoding="utf-8")
+    tmp_file.replace(cache_file)
 
-    with open(HELIOS_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(current_cache, f, indent=4)
+    # Any write invalidates the startup signature; prepare() records a new one
+    sig_file.unlink(missing_ok=True)
 
     if verbose:
-        print(f"Helios cache updated ({len(apps_to_include)} apps) for {selection} at {HELIOS_CACHE_FILE}")
+        print(f"Helios cache updated ({len(apps_to_include)} apps) for {selection_label} at {cache_file}")
+
+
+def _cache_signature(environment: EnvironmentAppsJSON, library_inputs: list[str]) -> dict:
+    """
+    mtimes of everything the Helios cache is derived from: the library
+    loaders' inputs, the environment's apps.json (managed flags) and the
+    Helios cache file itself (so hand edits are noticed).
+    """
+    cache_file = _cache_file()
+    paths = [*library_inputs, str(environment.apps_json_path), str(cache_file)]
+    return input_signature(paths)
+
+
+def check_cache_consistent(environment: EnvironmentAppsJSON, library_inputs: list[str]) -> bool:
+    """
+    True when nothing the Helios cache depends on changed since it was last
+    fully rebuilt, in which case rewriting it would produce the same file.
+    """
+    sig_file = _cache_sig_file()
+    try:
+        with open(sig_file, "r", encoding="utf-8") as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return stored == _cache_signature(environment, library_inputs)
+
+
+def record_cache_signature(environment: EnvironmentAppsJSON, library_inputs: list[str]) -> None:
+    """
+    Remember the inputs of a freshly rebuilt Helios cache.
+    """
+    sig_file = _cache_sig_file()
+    try:
+        with open(sig_file, "w", encoding="utf-8") as f:
+            json.dump(_cache_signature(environment, library_inputs), f)
+    except OSError:
+        pass
 
 
 def verify_helios_cache(all_libraries: dict, dry_run: bool = False) -> None:
     """
     Ensure Helios cache exists. If missing, rebuild it automatically for all libraries.
     """
-    HELIOS_CACHE_FILE = Path(os.getenv("LOCALAPPDATA")) / "Helios" / "apps.json"
-    if not HELIOS_CACHE_FILE.exists():
+    cache_file = _cache_file()
+    if not cache_file.exists():
         if dry_run:
-            dry_run_print(dry_run, f"Would rebuild Helios cache file: {HELIOS_CACHE_FILE}")
+            dry_run_print(dry_run, f"Would rebuild Helios cache file: {cache_file}")
         else:
             print("Helios cache missing, rebuilding for all libraries...")
             update_helios_cache(all_libraries, "all", dry_run=dry_run)
@@ -412,38 +655,41 @@ def handle_cache_option(all_libraries: dict, cache_selection: str, dry_run: bool
         update_helios_cache(all_libraries, cache_selection, dry_run=dry_run)
 
 
-def sort_apps(apps: dict, sort_key: str | None) -> list[dict]:
+def _canonical_id(app: dict) -> str:
     """
-    Return a sorted list of app dicts based on the provided key (name, source, uuid, managed).
+    The identifier shown for an app: its Helios UUID, falling back to appID.
     """
-    if not sort_key:
-        return list(apps.values())
+    return app.get("uuid") or app.get("appID") or ""
 
-    if sort_key == "name":
-        return sorted(apps.values(), key=lambda a: a.get("name", "").lower())
 
-    if sort_key == "source":
-        return sorted(apps.values(), key=lambda a: a.get("source", "").lower())
+# sort key name -> (key function, reverse)
+_SORT_KEYS = {
+    "name": (lambda a: a.get("name", "").lower(), False),
+    "source": (lambda a: a.get("source", "").lower(), False),
+    "uuid": (lambda a: _canonical_id(a).lower(), False),
+    # Managed first, then unmanaged
+    "managed": (lambda a: a.get("managed_by_helios", False), True),
+}
 
-    if sort_key == "uuid":
-        return sorted(
-            apps.values(),
-            key=lambda a: (a.get("uuid") or a.get("appID") or "").lower()
-        )
 
-    if sort_key == "managed":
-        # Managed first, then unmanaged
-        return sorted(
-            apps.values(),
-            key=lambda a: a.get("managed_by_helios", False),
-            reverse=True
-        )
+def sort_apps(apps: dict | list[dict], sort_key: str | None) -> list[dict]:
+    """
+    Return a sorted list of app dicts based on the provided key (name, source, uuid, managed).
+    sorted() evaluates each key function once per app, never per comparison.
+    """
+    if isinstance(apps, dict):
+        apps = apps.values()
+
+    spec = _SORT_KEYS.get(sort_key) if sort_key else None
+    if not spec:
+        return list(apps)
 
-    return list(apps.values())
+    key, reverse = spec
+    return sorted(apps, key=key, reverse=reverse)
 
 
 def list_apps(
-    libraries: dict,
+    libraries: dict | list[dict],
     sort_key: str | None = None,
     managed_only: bool = False,
     show_type: bool = True,
@@ -452,92 +698,84 @@ def list_apps(
 ) -> None:
     """
     Render a formatted ASCII table of applications.
+    Accepts a {uuid: app} dict or a plain list of apps.
     Column widths are dynamically calculated based on content.
     """
     apps = libraries
     if managed_only:
-        apps = {k: v for k, v in libraries.items() if v.get("managed_by_helios")}
+        pool = libraries.values() if isinstance(libraries, dict) else libraries
+        apps = [a for a in pool if a.get("managed_by_helios", False)]
 
     if not apps:
         print("No apps to display.")
         return
 
     sorted_apps = sort_apps(apps, sort_key)
+    app_ids = [_canonical_id(a) for a in sorted_apps]
+
+    # ---- dynamic column widths (single pass, then minimum floors) ----
+    name_width = source_width = uuid_width = type_width = managed_width = 0
+    for a, app_id in zip(sorted_apps, app_ids):
+        name_width = max(name_width, len(a.get("name", "")))
+        source_width = max(source_width, len(a.get("source", "")))
+        uuid_width = max(uuid_width, len(app_id))
+        if show_type:
+            type_width = max(type_width, len(str(a.get("type", ""))))
+        if show_managed:
+            managed_width = max(managed_width, len("Yes") if a.get("managed_by_helios", False) else len("No"))
 
-    # ---- dynamic column widths ----
-    name_width = max(max(len(a.get("name", "")) for a in sorted_apps), 20)
-
-    source_width = max(max(len(a.get("source", "")) for a in sorted_apps), 8)
-
-    uuid_width = max(
-        max(len(a.get("uuid") or a.get("appID") or "") for a in sorted_apps),
-        36,
-    )
-
-    if show_type:
-        type_width = max(
-            max(len(str(a.get("type", ""))) for a in sorted_apps),
-            6,
-        )
-    else:
-        type_width = 0
+    name_width = max(name_width, 20)
+    source_width = max(source_width, 8)
+    uuid_width = max(uuid_width, 36)
+    type_width = max(type_width, 6) if show_type else 0
+    managed_width = max(managed_width, len("Managed")) if show_managed else 0
 
     option_width = max(len(str(len(sorted_apps))), 6) if show_index else 0
 
-    if show_managed:
-        managed_width = max(
-            len("Managed"),
-            max(
-                len("Yes") if app.get("managed_by_helios") else len("No")
-                for app in sorted_apps
-            ),
-        )
-    else:
-        managed_width = 0
-
-    # ---- header ----
-    header_parts: list[str] = []
+    # ---- row template (widths baked in once) ----
+    col_widths: list[int] = []
+    header_cols: list[str] = []
     if show_index:
-        header_parts.append(f"{'Option':<{option_width}}")
+        col_widths.append(option_width)
+        header_cols.append("Option")
 
-    header_parts.extend([
-        f"{'Name':<{name_width}}",
-        f"{'Source':<{source_width}}",
-    ])
+    col_widths.extend([name_width, source_width])
+    header_cols.extend(["Name", "Source"])
 
     if show_type:
-        header_parts.append(f"{'Type':<{type_width}}")
+        col_widths.append(type_width)
+        header_cols.append("Type")
 
     if show_managed:
-        header_parts.append(f"{'Managed':<{managed_width}}")
-
-    header_parts.append(f"{'Helios ID (UUID)':<{uuid_width}}")
+        col_widths.append(managed_width)
+        header_cols.append("Managed")
 
-    header = " | ".join(header_parts)
-    print(header)
-    print("-" * len(header))
+    col_widths.append(uuid_width)
+    header_cols.append("Helios ID (UUID)")
 
-    # ---- rows ----
-    for idx, app in enumerate(sorted_apps, 1):
-        row_parts: list[str] = []
+    row_fmt = " | ".join(f"{{:<{w}}}" for w in col_widths).format
 
-        if show_index:
-            row_parts.append(f"{idx:<{option_width}}")
+    # ---- header ----
+    header = row_fmt(*header_cols)
+    out = [header, "-" * len(header)]
 
-        row_parts.extend([
-            f"{app.get('name', ''):<{name_width}}",
-            f"{str(app.get('source', '')).title():<{source_width}}",
-        ])
+    # ---- rows (buffered, written in one call) ----
+    for idx, (app, app_id) in enumerate(zip(sorted_apps, app_ids), 1):
+        cols: list = [idx] if show_index else []
+        cols.append(app.get("name", ""))
+        cols.append(str(app.get("source", "")).title())
 
         if show_type:
-            row_parts.append(f"{str(app.get('type', '')).title():<{type_width}}")
+            cols.append(str(app.get("type", "")).title())
 
         if show_managed:
-            row_parts.append(f"{'Yes' if app.get('managed_by_helios') else 'No':<{managed_width}}")
+            cols.append("Yes" if app.get("managed_by_helios", False) else "No")
 
-        row_parts.append(f"{(app.get('uuid') or app.get('appID') or ''):<{uuid_width}}")
+        cols.append(app_id)
 
-        print(" | ".join(row_parts))
+        out.append(row_fmt(*cols))
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def print_apps_with_status(apps: list[dict], status_map: dict[str, str]) -> None:
@@ -545,30 +783,30 @@ def print_apps_with_status(apps: list[dict], status_map: dict[str, str]) -> None
     Print a list of apps in a table style with a specific status column.
     Used for showing results of Add/Remove operations (e.g., "Already added").
     """
-    # Filter apps that actually have a status
-    apps_with_status = [
-        app for app in apps
-        if status_map.get(app.get("uuid") or app.get("appID"))
-    ]
+    # Filter apps that actually have a status, resolving each app's ID once
+    apps_with_status: list[tuple[dict, str, str]] = []
+    for app in apps:
+        app_id = _canonical_id(app)
+        status = status_map.get(app_id)
+        if status:
+            apps_with_status.append((app, app_id, status))
 
     if not apps_with_status:
         print("No apps with status to display.")
         return
 
-    # Determine column widths dynamically
-    name_width = max(max(len(a.get("name", "")) for a in apps_with_status), 20)
-    source_width = max(max(len(a.get("source", "")) for a in apps_with_status), 8)
-    uuid_width = max(
-        max(len(a.get("uuid") or a.get("appID") or "") for a in apps_with_status),
-        36,
-    )
-    status_width = max(
-        len("Status"),
-        max(
-            len(status_map.get(a.get("uuid") or a.get("appID")))
-            for a in apps_with_status
-        ),
-    )
+    # Determine column widths dynamically (single pass, then minimum floors)
+    name_width = source_width = uuid_width = status_width = 0
+    for a, app_id, status in apps_with_status:
+        name_width = max(name_width, len(a.get("name", "")))
+        source_width = max(source_width, len(a.get("source", "")))
+        uuid_width = max(uuid_width, len(app_id))
+        status_width = max(status_width, len(status))
+
+    name_width = max(name_width, 20)
+    source_width = max(source_width, 8)
+    uuid_width = max(uuid_width, 36)
+    status_width = max(status_width, len("Status"))
 
     # Header
     header = (
@@ -577,20 +815,19 @@ def print_apps_with_status(apps: list[dict], status_map: dict[str, str]) -> None
         f"{'Helios ID (UUID)':<{uuid_width}} | "
         f"{'Status':<{status_width}}"
     )
-    print(header)
-    print("-" * len(header))
+    out = [header, "-" * len(header)]
 
-    # Rows
-    for app in apps_with_status:
-        uuid = app.get("uuid") or app.get("appID") or ""
-        status = status_map.get(uuid)
+    # Rows (buffered, written in one call)
+    for app, app_id, status in apps_with_status:
         row = (
             f"{app.get('name', ''):<{name_width}} | "
             f"{str(app.get('source', '')).title():<{source_width}} | "
-            f"{uuid:<{uuid_width}} | "
+            f"{app_id:<{uuid_width}} | "
             f"{status:<{status_width}}"
         )
-        print(row)
+        out.append(row)
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def verify_managed_covers(
@@ -606,23 +843,30 @@ def verify_managed_covers(
     - Restores missing or invalid covers by checking the source library (Steam/Epic).
     - Optionally removes orphaned covers (files in folder but not in apps.json) if cleanup=True.
     """
-    covers_dir = Path(os.getenv("LOCALAPPDATA")) / "Helios" / "covers"
+    covers_dir = _covers_dir()
     covers_dir.mkdir(parents=True, exist_ok=True)
 
     restored = 0
     failed = 0
     removed = 0
 
+    # (app, environment app, saved cover path) for every restore attempt
+    results: list[tuple[dict, dict, str | None]] = []
+    # (uuid, app, environment app, url) for covers fetched over HTTP
+    http_jobs: list[tuple[str, dict, dict, str]] = []
+
     managed_uuids = {
         uuid for uuid, app in all_libraries.items()
-        if app.get("managed_by_helios")
+        if app.get("managed_by_helios", False)
     }
 
-    for uuid in managed_uuids:
-        dest = covers_dir / f"{uuid}.png"
+    # One directory read instead of an exists() probe per managed app
+    with os.scandir(covers_dir) as entries:
+        existing_covers = {e.name[:-4] for e in entries if e.name.lower().endswith(".png")}
 
+    for uuid in managed_uuids:
         # Skip if file exists and is a valid PNG
-        if dest.exists() and is_valid_png(dest):
+        if uuid in existing_covers and is_valid_png(covers_dir / f"{uuid}.png"):
             if verbose:
                 print(f"[SKIP] Valid cover already exists for {all_libraries[uuid].get('name')}")
             continue
@@ -638,11 +882,12 @@ def verify_managed_covers(
         # Prefer Helios library capsule
         image_source = app.get("library_capsule")
         image_path = None
+        is_http = False
 
         if image_source:
-            parsed = urllib.parse.urlparse(image_source)
-            if parsed.scheme in ("http", "https"):
+            if _is_http_url(image_source):
                 image_path = image_source  # HTTP URL
+                is_http = True
             else:
                 image_path = Path(image_source)
                 if not image_path.is_absolute() and environment.root:
@@ -659,8 +904,7 @@ def verify_managed_covers(
         # Validate final image path
         valid = False
         if image_path:
-            parsed = urllib.parse.urlparse(str(image_path))
-            if parsed.scheme in ("http", "https"):
+            if _is_http_url(str(image_path)):
                 valid = True
             elif Path(image_path).exists():
                 valid = True
@@ -673,7 +917,9 @@ def verify_managed_covers(
 
         if dry_run:
             dry_run_print(dry_run, f"Would restore cover for {app.get('name')}")
-            saved = True # pretend success
+        elif is_http:
+            # Network fetches are deferred and run concurrently below
+            http_jobs.append((uuid, app, environment_app, image_source))
         else:
             saved = save_library_capsule(
                 uuid,
@@ -681,32 +927,60 @@ def verify_managed_covers(
                 environment_root=environment.root,
                 verbose=verbose,
             )
+            results.append((app, environment_app, saved))
+
+    # Download HTTP covers in parallel over one pooled session
+    if http_jobs:
+        with requests.Session() as session, ThreadPoolExecutor(
+            max_workers=min(_COVER_DOWNLOAD_WORKERS, len(http_jobs))
+        ) as pool:
+            futures = {
+                pool.submit(
+                    save_library_capsule,
+                    uuid,
+                    url,
+                    environment_root=environment.root,
+                    verbose=verbose,
+                    session=session,
+                ): (app, environment_app)
+                for uuid, app, environment_app, url in http_jobs
+            }
+            for future in as_completed(futures):
+                app, environment_app = futures[future]
+                results.append((app, environment_app, future.result()))
+
+    environment_changed = False
+    for app, environment_app, saved in results:
+        if saved:
+            restored += 1
+            if environment_app.get("image-path") != saved:
+                environment_app["image-path"] = saved
+                environment_changed = True
+            if verbose:
+                print(f"[RESTORED] Cover art for {app.get('name')}")
+        else:
+            failed += 1
 
-            if saved:
-                restored += 1
-                if environment_app.get("image-path") != saved:
-                    environment_app["image-path"] = saved
-                    environment.save()
-                if verbose:
-                    print(f"[RESTORED] Cover art for {app.get('name')}")
-            else:
-                failed += 1
+    if environment_changed:
+        environment.save()
 
     # Cleanup orphaned covers
     if cleanup:
-        for file in covers_dir.iterdir():
-            if file.suffix.lower() != ".png":
-                continue
-            if file.stem not in managed_uuids:
-                try:
-                    if dry_run:
-                        dry_run_print(dry_run, f"Would delete orphaned cover {file}")
-                    else:
-                        file.unlink()
-                        removed += 1
-                except Exception as e:
-                    if verbose:
-                        print(f"[CLEANUP ERROR] {file.name}: {e}")
+        with os.scandir(covers_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.lower().endswith(".png"):
+                    continue
+                if name[:-4] not in managed_uuids:
+                    try:
+                        if dry_run:
+                            dry_run_print(dry_run, f"Would delete orphaned cover {entry.path}")
+                        else:
+                            os.unlink(entry.path)
+                            removed += 1
+                    except Exception as e:
+                        if verbose:
+                            print(f"[CLEANUP ERROR] {name}: {e}")
 
     if verbose:
         print(
@@ -722,6 +996,7 @@ def save_library_capsule(
     environment_root: Path | None = None,
     verbose: bool = False,
     dry_run: bool = False,
+    session: requests.Session | None = None,
 ) -> str | None:
     """
     Save library capsule to Helios covers as PNG.
@@ -731,12 +1006,13 @@ def save_library_capsule(
       - file:// URLs
       - absolute paths
       - relative paths from environment apps.json
+    An optional requests.Session is reused for HTTP downloads.
     Returns local PNG path or None.
     """
+    covers_dir = _covers_dir()
     if not isinstance(url_or_path, str) or not url_or_path.strip():
         return None
 
-    covers_dir = Path(os.getenv("LOCALAPPDATA")) / "Helios" / "covers"
     if dry_run:
         dry_run_print(dry_run, f"Would create directory: {covers_dir}")
     else:
@@ -745,46 +1021,57 @@ def save_library_capsule(
 
     # Already exists -> verify PNG
     if dest.exists():
-        try:
-            with Image.open(dest) as im:
-                if im.format != "PNG":
+        if is_valid_png(dest):
+            return str(dest)
 
+        if dry_run:
+            dry_run_print(dry_run, f"Would delete/restore corrupted cover {dest}")
+        else:
+            dest.unlink(missing_ok=True)
+            if verbose:
+                print(f"[INFO] {dest.name} is not a valid PNG, restoring.")
+
+    try:
+        # -------- HTTP / HTTPS --------
+        if _is_http_url(url_or_path):
+            with (session or requests).get(url_or_path, timeout=15, stream=True) as resp:
+                resp.raise_for_status()
+                chunks = resp.iter_content(chunk_size=64 * 1024)
+                head = next(chunks, b"")
+
+                # Already PNG -> stream bytes straight to disk, no decode/re-encode
+                if head[:8] == _PNG_SIG:
                     if dry_run:
-                        dry_run_print(dry_run, f"Would delete/restore corrupted cover {dest}")
+                        dry_run_print(dry_run, f"Would write downloaded PNG to {dest}")
                     else:
-                        dest.unlink(missing_ok=True)
-                        if verbose:
-                            print(f"[INFO] {dest.name} is not PNG, restoring.")
-
-                else:
+                        with open(dest, "wb") as f:
+                            f.write(head)
+                            for chunk in chunks:
+                                f.write(chunk)
                     return str(dest)
-        except Exception:
-            if dry_run:
-                dry_run_print(dry_run, f"Would delete/restore corrupted cover {dest}")
-            else:
-                dest.unlink(missing_ok=True)
-                if verbose:
-                    print(f"[INFO] {dest.name} corrupted, restoring.")
 
-    try:
-        # -------- HTTP / HTTPS --------
-        if url_or_path.lower().startswith(("http://", "https://")):
-            resp = requests.get(url_or_path, timeout=15)
-            resp.raise_for_status()
-            im = Image.open(BytesIO(resp.content))
-
-        # -------- file:// URL --------
-        elif url_or_path.lower().startswith("file://"):
-            img_path = Path(url_or_path[7:])
-            im = Image.open(img_path)
+                img_path = url_or_path
+                im = Image.open(BytesIO(head + b"".join(chunks)))
 
-        # -------- Local path --------
+        # -------- file:// URL / Local path --------
         else:
-            img_path = Path(url_or_path)
-            if not img_path.is_absolute() and environment_root:
-                img_path = environment_root / img_path
-            if not img_path.exists():
-                return None
+            if url_or_path.lower().startswith("file://"):
+                img_path = Path(url_or_path[7:])
+            else:
+                img_path = Path(url_or_path)
+                if not img_path.is_absolute() and environment_root:
+                    img_path = environment_root / img_path
+                if not img_path.exists():
+                    return None
+
+            # Already PNG -> let the OS copy the file, no decode/re-encode
+            if is_valid_png(img_path):
+                if dry_run:
+                    dry_run_print(dry_run, f"Would copy PNG {img_path} to {dest}")
+                else:
+                    shutil.copyfile(img_path, dest)
+                return str(dest)
+
             im = Image.open(img_path)
 
         # Convert to PNG if not already
@@ -818,43 +1105,22 @@ def add_games(
     Interactive logic to add games.
     Resolves input -> Finds matches -> Filters for already added -> Prompts user -> Adds.
     """
-    search_terms = [s.strip() for s in input_str.split(",") if s.strip()]
-    all_matches: list[dict] = []
-
     # -------- Resolve UUIDs + name matches --------
-    for term in search_terms:
-        # Exact UUID match first
-        app = all_libraries.get(term)
-        if app:
-            all_matches.append(app)
-            continue
-
-        # Fuzzy name match
-        matches = [
-            a for a in all_libraries.values()
-            if term.lower() in a.get("name", "").lower()
-        ]
-        all_matches.extend(matches)
-
-    # De-duplicate by UUID
-    all_matches = list({a["uuid"]: a for a in all_matches}.values())
+    all_matches = resolve_apps_by_input(all_libraries, input_str)
 
     if not all_matches:
         print("No apps found matching your input.")
         return
 
-    installs = find_environment_installs("all")
+    installs = _cached_installs("all")
     environment_name = installs[0].get("display_name") if installs else "Unknown"
 
-    # -------- Split into already-added vs unmanaged --------
-    already_added = [
-        a for a in all_matches
-        if environment.get_app_by_uuid(a["uuid"])
-    ]
-    unmanaged_matches = [
-        a for a in all_matches
-        if not environment.get_app_by_uuid(a["uuid"])
-    ]
+    # -------- Split into already-added vs unmanaged (one pass) --------
+    env_uuids = environment.by_uuid.keys()
+    already_added: list[dict] = []
+    unmanaged_matches: list[dict] = []
+    for a in all_matches:
+        (already_added if a["uuid"] in env_uuids else unmanaged_matches).append(a)
 
     # -------- Already added (informational) --------
     if already_added and verbose:
@@ -874,7 +1140,7 @@ def add_games(
     # -------- Select unmanaged apps to add --------
     print("Unmanaged apps matching your input:")
     list_apps(
-        {a["uuid"]: a for a in unmanaged_matches},
+        unmanaged_matches,
         show_index=True,
         show_managed=False,
     )
@@ -883,157 +1149,166 @@ def add_games(
         "Enter numbers to add (comma-separated), 'all', or 'exit' / 'q': "
     ).strip().lower()
 
-    if selection in {"q", "quit", "exit", ""}:
+    if selection in _EXIT_TOKENS:
         print("Selection cancelled.")
         return
 
     if selection == "all":
         selected_apps = unmanaged_matches
     else:
-        try:
-            indices = {
-                int(x) - 1
-                for x in selection.split(",")
-                if x.strip().isdigit()
-            }
-        except ValueError:
-            print("Invalid input, aborting.")
-            return
-
-        selected_apps = [
-            unmanaged_matches[i]
-            for i in indices
-            if 0 <= i < len(unmanaged_matches)
-        ]
+        indices = _parse_selection(selection, len(unmanaged_matches))
+        selected_apps = [unmanaged_matches[i] for i in indices]
 
     if not selected_apps:
         print("No valid selections made.")
         return
 
     # -------- Add --------
-    for app in selected_apps:
-        _add_game(environment, all_libraries, app, verbose=verbose, dry_run=dry_run)
+    _add_games_batch(environment, all_libraries, selected_apps, verbose=verbose, dry_run=dry_run)
 
 
-def _add_game(
+def _add_games_batch(
     environment: EnvironmentAppsJSON,
     all_libraries: dict,
-    app_data: dict,
+    apps: list[dict],
     verbose: bool = False,
     dry_run: bool = False,
-) -> bool:
+) -> list[dict]:
     """
-    Writes the game entry to the environment's apps.json and saves the cover image.
+    Writes several game entries to the environment's apps.json and saves their cover images.
+    All entries are accumulated in memory and apps.json is written once at the end.
     Requires Admin privileges.
+    Returns the list of apps that were (or would be) added.
     """
-    uuid = app_data['uuid']
+    pending: list[dict] = []
+    seen: set[str] = set()
+    for app_data in apps:
+        uuid = app_data['uuid']
+        if uuid in seen:
+            continue  # same app requested twice, e.g. --add X,X
+        seen.add(uuid)
+
+        if environment.get_app_by_uuid(uuid):
+            if verbose:
+                print(f"{app_data['name']} ({uuid}) is already in apps.json, skipping add.")
+            continue
 
-    if environment.get_app_by_uuid(uuid):
-        if verbose:
-            print(f"{app_data['name']} ({uuid}) is already in apps.json, skipping add.")
-        return False
+        if dry_run:
+            dry_run_print(dry_run, f"Would add {app_data['name']} ({uuid}) to apps.json")
+        pending.append(app_data)
 
-    if dry_run:
-        dry_run_print(dry_run, f"Would add {app_data['name']} ({uuid}) to apps.json")
-        return True
+    if not pending or dry_run:
+        return pending
 
     if not check_admin_write(environment.apps_json_path):
-        return False
+        return []
 
-    # Save library capsule
-    image_path = save_library_capsule(
-        uuid,
-        app_data.get("library_capsule"),
-        environment_root=environment.root,
-        verbose=verbose,
-    )
+    for app_data in pending:
+        uuid = app_data['uuid']
 
-    app_entry = {
-        "uuid": uuid,
-        "name": app_data['name'],
-        "cmd": app_data.get("launch") or "",
-        "image-path": image_path or "",
-    }
+        # Save library capsule
+        image_path = save_library_capsule(
+            uuid,
+            app_data.get("library_capsule"),
+            environment_root=environment.root,
+            verbose=verbose,
+        )
 
-    if not dry_run:
+        app_entry = {
+            "uuid": uuid,
+            "name": app_data['name'],
+            "cmd": app_data.get("launch") or "",
+            "image-path": image_path or "",
+        }
         environment.apps.append(app_entry)
         environment.by_uuid[uuid] = app_entry
-        environment.save()
-    else:
-        dry_run_print(dry_run, f"Would write updated apps.json")
+
+    environment.save()
 
     if verbose:
-        installs = find_environment_installs("all")
+        installs = _cached_installs("all")
         environment_name = installs[0].get("display_name") if installs else "Environment"
-        print(f"Added {app_data['name']} ({uuid}) to {environment_name} and updated managed flags.")
-    return True
+        for app_data in pending:
+            print(f"Added {app_data['name']} ({app_data['uuid']}) to {environment_name} and updated managed flags.")
+    return pending
 
 
-def _remove_game(
+def _remove_games_batch(
     environment: EnvironmentAppsJSON,
     all_libraries: dict,
-    game_data: dict,
+    games: list[dict],
     verbose: bool = False,
     dry_run: bool = False,
-) -> bool:
+) -> list[dict]:
     """
-    Removes the game entry from the environment's apps.json and deletes the cover image.
+    Removes several game entries from the environment's apps.json and deletes their cover images.
+    apps.json is filtered and written once for the whole batch.
     Requires Admin privileges.
+    Returns the list of apps that were (or would be) removed.
     """
-    uuid = game_data['uuid']
+    covers_dir = _covers_dir()
+    pending: list[dict] = []
+    seen: set[str] = set()
+    for game_data in games:
+        uuid = game_data['uuid']
+        if uuid in seen:
+            continue
+        seen.add(uuid)
 
-    if not environment.get_app_by_uuid(uuid):
-        if verbose:
-            print(f"{game_data['name']} ({uuid}) not found in apps.json, skipping removal.")
-        return False
+        if not environment.get_app_by_uuid(uuid):
+            if verbose:
+                print(f"{game_data['name']} ({uuid}) not found in apps.json, skipping removal.")
+            continue
 
-    if dry_run:
-        dry_run_print(dry_run, f"Would remove {game_data['name']} ({uuid}) from apps.json")
-        return True
+        if dry_run:
+            dry_run_print(dry_run, f"Would remove {game_data['name']} ({uuid}) from apps.json")
+        pending.append(game_data)
+
+    if not pending or dry_run:
+        return pending
 
     if not check_admin_write(environment.apps_json_path):
-        return False
+        return []
 
     # Remove from environment
-    if not dry_run:
-        environment.apps = [app for app in environment.apps if app.get("uuid") != uuid]
+    removed_uuids = {g['uuid'] for g in pending}
+    environment.apps = [app for app in environment.apps if app.get("uuid") not in removed_uuids]
+    for uuid in removed_uuids:
         environment.by_uuid.pop(uuid, None)
-        environment.data['apps'] = environment.apps
-        environment.save()
-    else:
-        dry_run_print(dry_run, f"Would update apps.json to remove {uuid}")
+    environment.data['apps'] = environment.apps
+    environment.save()
 
-    # Remove cover
-    cover_path = Path(os.getenv("LOCALAPPDATA")) / "Helios" / "covers" / f"{uuid}.png"
-    if cover_path.exists():
-        if dry_run:
-            dry_run_print(dry_run, f"Would delete cover {cover_path}")
-        else:
-            cover_path.unlink(missing_ok=True)
+    # Remove covers
+    for game_data in pending:
+        cover_path = covers_dir / f"{game_data['uuid']}.png"
+        cover_path.unlink(missing_ok=True)
 
-    if verbose:
-        print(f"Removed {game_data['name']} ({uuid}) from apps.json")
-    return True
+        if verbose:
+            print(f"Removed {game_data['name']} ({game_data['uuid']}) from apps.json")
+    return pending
 
 def print_helios_status(steam_apps: dict, epic_apps: dict, all_libraries: dict) -> None:
     """
     Prints a high-level summary of managed games vs total discovered games.
     """
-    managed_apps = [v for v in all_libraries.values() if v.get("managed_by_helios")]
-
-    covers_dir = Path(os.getenv("LOCALAPPDATA")) / "Helios" / "covers"
-    cover_files: list[Path] = []
+    covers_dir = _covers_dir()
+    # Single pass over the library for both the count and the UUID set
+    managed_count = 0
+    managed_cover_uuids: set[str] = set()
+    for app in all_libraries.values():
+        if app.get("managed_by_helios", False):
+            managed_count += 1
+            uuid = app.get("uuid")
+            if uuid:
+                managed_cover_uuids.add(uuid)
+
+    # Only the file stems are needed, so skip building Path objects
+    cover_stems: list[str] = []
     if covers_dir.exists():
-        cover_files = [f for f in covers_dir.iterdir() if f.suffix.lower() == ".png"]
-
-    managed_cover_uuids = {
-        app["uuid"] for app in managed_apps
-        if "uuid" in app
-    }
+        with os.scandir(covers_dir) as entries:
+            cover_stems = [e.name[:-4] for e in entries if e.name.lower().endswith(".png")]
 
-    orphaned_covers = [
-        f for f in cover_files if f.stem not in managed_cover_uuids
-    ]
+    orphaned_count = sum(1 for stem in cover_stems if stem not in managed_cover_uuids)
 
     print("\nHelios Status")
     print("=" * 13)
@@ -1041,23 +1316,449 @@ def print_helios_status(steam_apps: dict, epic_apps: dict, all_libraries: dict)
     print(f"Epic apps discovered:       {len(epic_apps)}")
     print(f"Total discovered apps:      {len(all_libraries)}\n")
 
-    print(f"Managed by Helios:          {len(managed_apps)}")
-    print(f"Unmanaged apps:             {len(all_libraries) - len(managed_apps)}\n")
+    print(f"Managed by Helios:          {managed_count}")
+    print(f"Unmanaged apps:             {len(all_libraries) - managed_count}\n")
 
     print("Helios covers:")
-    print(f"  Total covers on disk:     {len(cover_files)}")
-    print(f"  Managed covers:           {len(cover_files) - len(orphaned_covers)}")
-    print(f"  Orphaned covers:          {len(orphaned_covers)}\n")
+    print(f"  Total covers on disk:     {len(cover_stems)}")
+    print(f"  Managed covers:           {len(cover_stems) - orphaned_count}")
+    print(f"  Orphaned covers:          {orphaned_count}\n")
 
 
-def get_helios_type(helios: dict, uuid: str) -> str | None:
+def get_helios_type(helios: dict, uuid: str) -> str:
     """
     Retrieve the Helios-defined 'type' field for a given UUID.
+    Returned lowercased, or "" if the app or its type is unknown.
     """
     app = helios.get(uuid)
     if not app:
-        return None
-    return app.get("type")
+        return ""
+    app_type = app.get("type")
+    return app_type.lower() if app_type else ""
+
+
+# =====================================================================
+#                               WORKFLOWS
+# =====================================================================
+
+@dataclass
+class _FilterIndex:
+    """
+    Normalized name and lowercased source/type per UUID, computed once and
+    shared by the --search/--source/--type filters of every workflow.
+    """
+    name_norm: dict[str, str]
+    source_lc: dict[str, str]
+    type_lc: dict[str, str]
+
+
+@dataclass
+class _LibraryState:
+    """
+    Merged Steam + Epic library for one run, and whether its
+    managed_by_helios flags have been computed against the environment.
+    """
+    all_libraries: dict
+    marked: bool = False
+    index: _FilterIndex | None = None
+
+
+def build_filter_index(all_libraries: dict) -> _FilterIndex:
+    """
+    Normalize every app's name and lowercase its source and type once.
+    """
+    return _FilterIndex(
+        name_norm={u: _normalize_name(a.get("name", "")) for u, a in all_libraries.items()},
+        source_lc={u: a.get("source", "").lower() for u, a in all_libraries.items()},
+        type_lc={u: get_helios_type(all_libraries, u) for u in all_libraries},
+    )
+
+
+def _split_terms(parts: str | list[str] | None) -> list[str]:
+    """
+    Flatten CLI filter values like ["a,b", "c"] into lowercased terms.
+    """
+    if not parts:
+        return []
+    if isinstance(parts, str):
+        parts = [parts]
+    return [
+        term.strip().lower()
+        for part in parts
+        for term in part.split(",")
+        if term.strip()
+    ]
+
+
+def has_filters(args: argparse.Namespace) -> bool:
+    """
+    True when any of --search, --type or --source was given.
+    """
+    return any((args.search, args.type, args.source))
+
+
+def apply_filters(pool: list[dict], args: argparse.Namespace, index: _FilterIndex) -> list[dict]:
+    """
+    Apply the --search, --type and --source filters to a list of apps.
+    Single implementation used by the add, remove and list workflows.
+    """
+    search_terms = [_normalize_name(t) for t in _split_terms(args.search)]
+    if search_terms:
+        name_norm = index.name_norm
+        pool = [
+            a for a in pool
+            if any(term in name_norm[a["uuid"]] for term in search_terms)
+        ]
+
+    type_terms = _split_terms(args.type)
+    if type_terms:
+        type_lc = index.type_lc
+        pool = [
+            a for a in pool
+            if any(term in type_lc[a["uuid"]] for term in type_terms)
+        ]
+
+    source_terms = set(_split_terms(args.source))
+    if source_terms:
+        source_lc = index.source_lc
+        pool = [a for a in pool if source_lc[a["uuid"]] in source_terms]
+
+    return pool
+
+
+class HeliosContext:
+    """
+    State shared by the CLI workflows for a single run.
+    The environment, libraries and startup verification are only built
+    when a workflow first asks for them.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.dry_run: bool = args.dry_run
+        self._environment: EnvironmentAppsJSON | None = None
+        self._steam_apps: dict | None = None
+        self._epic_apps: dict | None = None
+        self._steam_inputs: list[str] = []
+        self._epic_inputs: list[str] = []
+        self._library: _LibraryState | None = None
+        self._verified = False
+
+    @property
+    def environment(self) -> EnvironmentAppsJSON:
+        if self._environment is None:
+            self._environment = get_environment_apps()
+        return self._environment
+
+    @property
+    def environment_name(self) -> str:
+        installs = _cached_installs("all")
+        return installs[0].get("display_name") if installs else "Unknown"
+
+    def steam(self) -> dict:
+        if self._steam_apps is None:
+            try:
+                self._steam_apps, self._steam_inputs = get_steam_library(self.dry_run)
+            except Exception:
+                self._steam_apps = {}
+        return self._steam_apps
+
+    def epic(self) -> dict:
+        if self._epic_apps is None:
+            try:
+                self._epic_apps, self._epic_inputs = get_installed_epic_games(self.dry_run)
+            except Exception:
+                self._epic_apps = {}
+        return self._epic_apps
+
+    def all_libraries(self) -> dict:
+        """
+        Merged Steam + Epic library, built once per run.
+        """
+        if self._library is None:
+            libs: dict = {}
+            libs.update(self.steam())
+            libs.update(self.epic())
+            self._library = _LibraryState(libs)
+        return self._library.all_libraries
+
+    def library_inputs(self) -> list[str]:
+        """
+        Input files of the libraries that loaded successfully this run.
+        """
+        return [*self._steam_inputs, *self._epic_inputs]
+
+    def filter_index(self) -> _FilterIndex:
+        """
+        Lowercased lookup tables for the CLI filters, built once per run.
+        """
+        self.all_libraries()
+        if self._library.index is None:
+            self._library.index = build_filter_index(self._library.all_libraries)
+        return self._library.index
+
+    def set_managed(self, apps: list[dict], managed: bool) -> None:
+        """
+        Record an add/remove on the in-memory library instead of re-marking
+        every app against the environment.
+        """
+        if self.dry_run:
+            return
+        for app in apps:
+            app["managed_by_helios"] = managed
+
+    def prepare(self) -> dict:
+        """
+        Return all libraries with managed flags set, running the Helios
+        setup verification (cache, covers) the first time it is needed.
+        """
+        all_libraries = self.all_libraries()
+        if not self._library.marked:
+            mark_helios_managed_apps(all_libraries, self.environment)
+            self._library.marked = True
+        if self._verified:
+            return all_libraries
+
+        dry_run = self.dry_run
+        verbose = self.args.verbose
+        verify_helios_cache(all_libraries, dry_run=dry_run)
+        verify_helios_covers_dir(verbose=verbose, dry_run=dry_run)
+        verify_managed_covers(all_libraries, self.environment, verbose=verbose, dry_run=dry_run)
+        library_inputs = self.library_inputs()
+        if not check_cache_consistent(self.environment, library_inputs):
+            update_helios_cache(all_libraries, selection="all", verbose=False, dry_run=dry_run)
+            if not dry_run:
+                record_cache_signature(self.environment, library_inputs)
+        self._verified = True
+        return all_libraries
+
+
+def handle_cache(ctx: HeliosContext) -> None:
+    """
+    --cache workflow: rebuild the Helios cache for the selected source.
+    """
+    handle_cache_option(ctx.prepare(), ctx.args.cache, dry_run=ctx.dry_run)
+
+
+def run_workflow(
+    ctx: HeliosContext,
+    *,
+    explicit_arg: list[str] | None,
+    pool_managed: bool,
+    action_fn,
+    verb: str,
+    pool_label: str,
+    skipped_status: str,
+    done_status: str,
+    results_title: str,
+) -> None:
+    """
+    Shared --add/--remove workflow: resolve explicit UUIDs and/or a filtered
+    interactive selection from the apps whose managed flag is `pool_managed`,
+    apply `action_fn` to them in one batch, then flip their managed flags.
+    """
+    args = ctx.args
+    dry_run = ctx.dry_run
+    environment = ctx.environment
+    all_libraries = ctx.prepare()
+
+    pool = [
+        app for app in all_libraries.values()
+        if app.get("managed_by_helios", False) is pool_managed
+    ]
+
+    explicit_apps: list[dict] = []
+    status_map: dict[str, str] = {}
+
+    pool_by_uuid = {a["uuid"]: a for a in pool}
+    for uuid in parse_uuid_args(explicit_arg):
+        app = pool_by_uuid.get(uuid)
+
+        if app:
+            explicit_apps.append(app)
+        elif uuid in all_libraries:
+            status_map[uuid] = skipped_status
+        else:
+            status_map[uuid] = "UUID not found"
+
+    explicit_uuid_set = {a["uuid"] for a in explicit_apps}
+    interactive_pool = [a for a in pool if a["uuid"] not in explicit_uuid_set]
+
+    if has_filters(args):
+        # The filter index is only built when a filter actually needs it
+        interactive_pool = apply_filters(interactive_pool, args, ctx.filter_index())
+    elif explicit_arg:
+        interactive_pool = []
+
+    selected_apps: list[dict] = []
+
+    if interactive_pool:
+        print(f"{pool_label} apps matching your filters:")
+        list_apps(
+            interactive_pool,
+            show_index=True,
+            show_managed=False,
+        )
+
+        selection = input(
+            f"Enter numbers to {verb} (comma-separated), 'all', or 'q': "
+        ).strip().lower()
+
+        if selection not in _EXIT_TOKENS:
+            if selection == "all":
+                selected_apps = interactive_pool
+            else:
+                indices = _parse_selection(selection, len(interactive_pool))
+                selected_apps = [interactive_pool[i] for i in indices]
+
+    chosen = explicit_apps + selected_apps
+    for app in chosen:
+        status_map[app["uuid"]] = done_status
+
+    changed = action_fn(environment, all_libraries, chosen, verbose=args.verbose, dry_run=dry_run)
+
+    if changed:
+        ctx.set_managed(changed, not pool_managed)
+        update_helios_cache(
+            all_libraries,
+            selection=[a["uuid"] for a in changed],
+            verbose=False,
+            dry_run=dry_run,
+        )
+
+    if status_map:
+        print(f"\n{results_title}:")
+        apps_for_status = [
+            all_libraries[uuid]
+            for uuid in status_map
+            if uuid in all_libraries
+        ]
+        print_apps_with_status(apps_for_status, status_map)
+
+
+def handle_add(ctx: HeliosContext) -> None:
+    """
+    --add workflow: add unmanaged apps to the environment.
+    """
+    environment_name = ctx.environment_name
+    run_workflow(
+        ctx,
+        explicit_arg=ctx.args.add,
+        pool_managed=False,
+        action_fn=_add_games_batch,
+        verb="add",
+        pool_label="Unmanaged",
+        skipped_status=f"Already added to {environment_name} and managed by Helios",
+        done_status=f"Added to {environment_name} and managed by Helios",
+        results_title="Add results",
+    )
+
+
+def handle_remove(ctx: HeliosContext) -> None:
+    """
+    --remove workflow: remove Helios-managed apps from the environment.
+    """
+    environment_name = ctx.environment_name
+    run_workflow(
+        ctx,
+        explicit_arg=ctx.args.remove,
+        pool_managed=True,
+        action_fn=_remove_games_batch,
+        verb="remove",
+        pool_label="Managed",
+        skipped_status="Not currently managed by Helios",
+        done_status=f"Removed from {environment_name} by Helios",
+        results_title="Removal results",
+    )
+
+
+def handle_cleanup(ctx: HeliosContext) -> None:
+    """
+    --cleanup-covers workflow: verify managed covers and delete orphaned ones.
+    """
+    all_libraries = ctx.prepare()
+    verify_managed_covers(
+        all_libraries,
+        ctx.environment,
+        cleanup=True,
+        verbose=True,
+        dry_run=ctx.dry_run,
+    )
+
+
+def handle_status(ctx: HeliosContext) -> None:
+    """
+    --status workflow: print info for a single library or the Helios overview.
+    """
+    library = ctx.args.status.lower()
+    show_sample = ctx.args.show_sample
+
+    if library in ("apollo", "sunshine"):
+        # Reads the environment's own install info; no library loading needed
+        print_library_info(library, show_sample=show_sample)
+        return
+
+    steam = ctx.steam()
+    epic = ctx.epic()
+
+    if library == "steam":
+        print_library_info("steam", steam_apps=steam, show_sample=show_sample)
+        return
+
+    if library == "nonsteam":
+        print_library_info("nonsteam", steam_apps=steam, show_sample=show_sample)
+        return
+
+    if library == "epic":
+        print_library_info("epic", epic_apps=epic, show_sample=show_sample)
+        return
+
+    if library in ("helios", ""):
+        all_libs = ctx.prepare()
+        print_helios_status(steam, epic, all_libs)
+        return
+
+    print(f"Unknown library: {library}")
+    return
+
+
+def handle_list(ctx: HeliosContext) -> None:
+    """
+    --list workflow: print the filtered and sorted app table.
+    """
+    args = ctx.args
+    all_libraries = ctx.prepare()
+
+    apps_to_show = list(all_libraries.values())
+
+    if has_filters(args):
+        apps_to_show = apply_filters(apps_to_show, args, ctx.filter_index())
+
+    if args.managed is not None:
+        apps_to_show = [
+            a for a in apps_to_show
+            if a.get("managed_by_helios", False) is args.managed
+        ]
+
+    if not apps_to_show:
+        print("No apps found matching your filters.")
+        return
+
+    list_apps(
+        apps_to_show,
+        sort_key=args.sort,
+    )
+
+
+# Workflow registry, in execution order
+COMMANDS = {
+    "cache": handle_cache,
+    "add": handle_add,
+    "remove": handle_remove,
+    "cleanup": handle_cleanup,
+    "status": handle_status,
+    "list": handle_list,
+}
 
 
 # =====================================================================
@@ -1165,8 +1866,6 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    dry_run = args.dry_run
-
     # ------------------------ Default Behavior ------------------------
     if len(sys.argv) == 1:
         parser.print_help()
@@ -1183,430 +1882,20 @@ def main() -> None:
 
 
 
-    # Detect installed environments (Apollo/Sunshine/etc.)
-    environment_install = find_environment_installs("all")
-    environment_name = environment_install[0].get("display_name") if environment_install else "Unknown"
-
-        # ------------------------ Load environment (always required) ------------------------
-    environment = get_environment_apps()
-
-    # Lazy-loaded libraries
-    steam_apps: dict | None = None
-    epic_apps: dict | None = None
-
-    def ensure_steam_loaded() -> dict:
-        nonlocal steam_apps
-        if steam_apps is None:
-            try:
-                steam_apps = get_steam_library()
-            except Exception:
-                steam_apps = {}
-        return steam_apps
-
-    def ensure_epic_loaded() -> dict:
-        nonlocal epic_apps
-        if epic_apps is None:
-            try:
-                epic_apps = get_installed_epic_games()
-            except Exception:
-                epic_apps = {}
-        return epic_apps
-
-    def get_all_libraries() -> dict:
-        libs: dict = {}
-        libs.update(ensure_steam_loaded())
-        libs.update(ensure_epic_loaded())
-        return libs
-
-    # ------------------------ Verify Setup ------------------------
-    all_libraries = get_all_libraries()
-    all_libraries = mark_helios_managed_apps(all_libraries, environment)
-
-    verify_helios_cache(all_libraries, dry_run=dry_run)
-    verify_helios_covers_dir(verbose=args.verbose, dry_run=dry_run)
-    verify_managed_covers(all_libraries, environment, verbose=args.verbose, dry_run=dry_run)
-    mark_helios_managed_apps(all_libraries, environment, dry_run=dry_run)
-    update_helios_cache(all_libraries, selection="all", verbose=False, dry_run=dry_run)
-
-    # ------------------------ Handle --cache ------------------------
-    if args.cache:
-        handle_cache_option(all_libraries, args.cache, dry_run=dry_run)
-
-    # =================================================================
-    #                           ADD WORKFLOW
-    # =================================================================
-    if args.add is not None:
-        all_libraries = get_all_libraries()
-        all_libraries = mark_helios_managed_apps(all_libraries, environment, dry_run=dry_run)
-
-        unmanaged_apps = [
-            app for app in all_libraries.values()
-            if not app.get("managed_by_helios")
-        ]
-
-        explicit_apps: list[dict] = []
-        interactive_pool = unmanaged_apps.copy()
-        status_map: dict[str, str] = {}
-
-        explicit_uuids = parse_uuid_args(args.add)
-
-        for uuid in explicit_uuids:
-            app = next((a for a in unmanaged_apps if a["uuid"] == uuid), None)
-
-            if app:
-                explicit_apps.append(app)
-            else:
-                app_full = all_libraries.get(uuid)
-                if app_full:
-                    status_map[uuid] = f"Already added to {environment_name} and managed by Helios"
-                else:
-                    status_map[uuid] = "UUID not found"
-
-        explicit_uuid_set = {a["uuid"] for a in explicit_apps}
-        interactive_pool = [
-            a for a in interactive_pool if a["uuid"] not in explicit_uuid_set
-        ]
-
-        filters_present = any([args.search, args.source, args.type])
-        has_explicit_uuids = bool(args.add)
-
-        if filters_present or not has_explicit_uuids:
-            if args.search:
-                search_terms = [
-                    term.strip().lower()
-                    for part in args.search
-                    for term in part.split(",")
-                    if term.strip()
-                ]
-                interactive_pool = [
-                    a for a in interactive_pool
-                    if any(term in a.get("name", "").lower() for term in search_terms)
-                ]
-
-            if args.type:
-                type_terms = [
-                    term.strip().lower()
-                    for part in args.type
-                    for term in part.split(",")
-                    if term.strip()
-                ]
-                interactive_pool = [
-                    a for a in interactive_pool
-                    if any(
-                        term in str(get_helios_type(all_libraries, a["uuid"]) or "").lower()
-                        for term in type_terms
-                    )
-                ]
-
-            if args.source:
-                source_terms = {
-                    s.strip().lower()
-                    for part in args.source
-                    for s in part.split(",")
-                    if s.strip()
-                }
-                interactive_pool = [
-                    a for a in interactive_pool
-                    if a.get("source", "").lower() in source_terms
-                ]
-        else:
-            interactive_pool = []
-
-        selected_apps: list[dict] = []
-
-        if interactive_pool:
-            print("Unmanaged apps matching your filters:")
-            list_apps(
-                {a["uuid"]: a for a in interactive_pool},
-                show_index=True,
-                show_managed=False,
-            )
-
-            selection = input(
-                "Enter numbers to add (comma-separated), 'all', or 'q': "
-            ).strip().lower()
-
-            if selection not in {"", "q", "quit", "exit"}:
-                if selection == "all":
-                    selected_apps = interactive_pool
-                else:
-                    indices = {
-                        int(x) - 1
-                        for x in selection.split(",")
-                        if x.strip().isdigit()
-                    }
-                    selected_apps = [
-                        interactive_pool[i]
-                        for i in indices
-                        if 0 <= i < len(interactive_pool)
-                    ]
-
-        all_added: list[dict] = []
-
-        for app in explicit_apps + selected_apps:
-            _add_game(environment, all_libraries, app, verbose=args.verbose, dry_run=dry_run)
-            status_map[app["uuid"]] = f"Added to {environment_name} and managed by Helios"
-            all_added.append(app)
-
-        if all_added:
-            all_libraries = get_all_libraries()
-            mark_helios_managed_apps(all_libraries, environment, dry_run=dry_run)
-            update_helios_cache(all_libraries, selection="all", verbose=False, dry_run=dry_run)
-
-        if status_map:
-            print("\nAdd results:")
-            apps_for_status = [
-                all_libraries.get(uuid)
-                for uuid in status_map
-                if all_libraries.get(uuid)
-            ]
-            print_apps_with_status(apps_for_status, status_map)
-
-    # =================================================================
-    #                          REMOVE WORKFLOW
-    # =================================================================
-    if args.remove is not None:
-        all_libraries = get_all_libraries()
-        all_libraries = mark_helios_managed_apps(all_libraries, environment, dry_run=dry_run)
-
-        managed_apps = [
-            app for app in all_libraries.values()
-            if app.get("managed_by_helios")
-        ]
-
-        explicit_apps: list[dict] = []
-        interactive_pool = managed_apps.copy()
-        status_map: dict[str, str] = {}
-
-        explicit_uuids = parse_uuid_args(args.remove)
-
-        for uuid in explicit_uuids:
-            app = next((a for a in managed_apps if a["uuid"] == uuid), None)
-
-            if app:
-                explicit_apps.append(app)
-            else:
-                app_full = all_libraries.get(uuid)
-                if app_full:
-                    status_map[uuid] = "Not currently managed by Helios"
-                else:
-                    status_map[uuid] = "UUID not found"
-
-        explicit_uuid_set = {a["uuid"] for a in explicit_apps}
-        interactive_pool = [
-            a for a in interactive_pool if a["uuid"] not in explicit_uuid_set
-        ]
-
-        filters_present = any([args.search, args.source, args.type])
-        has_explicit_uuids = bool(args.remove)
-
-        if filters_present or not has_explicit_uuids:
-            if args.search:
-                search_terms = [
-                    term.strip().lower()
-                    for part in args.search
-                    for term in part.split(",")
-                    if term.strip()
-                ]
-                interactive_pool = [
-                    a for a in interactive_pool
-                    if any(term in a.get("name", "").lower() for term in search_terms)
-                ]
-
-            if args.type:
-                type_terms = [
-                    term.strip().lower()
-                    for part in args.type
-                    for term in part.split(",")
-                    if term.strip()
-                ]
-                interactive_pool = [
-                    a for a in interactive_pool
-                    if any(
-                        term in str(get_helios_type(all_libraries, a["uuid"]) or "").lower()
-                        for term in type_terms
-                    )
-                ]
-
-            if args.source:
-                source_terms = {
-                    s.strip().lower()
-                    for part in args.source
-                    for s in part.split(",")
-                    if s.strip()
-                }
-                interactive_pool = [
-                    a for a in interactive_pool
-                    if a.get("source", "").lower() in source_terms
-                ]
-        else:
-            interactive_pool = []
-
-        selected_apps: list[dict] = []
-
-        if interactive_pool:
-            print("Managed apps matching your filters:")
-            list_apps(
-                {a["uuid"]: a for a in interactive_pool},
-                show_index=True,
-                show_managed=False,
-            )
-
-            selection = input(
-                "Enter numbers to remove (comma-separated), 'all', or 'q': "
-            ).strip().lower()
-
-            if selection not in {"", "q", "quit", "exit"}:
-                if selection == "all":
-                    selected_apps = interactive_pool
-                else:
-                    indices = {
-                        int(x) - 1
-                        for x in selection.split(",")
-                        if x.strip().isdigit()
-                    }
-                    selected_apps = [
-                        interactive_pool[i]
-                        for i in indices
-                        if 0 <= i < len(interactive_pool)
-                    ]
-
-        all_removed: list[dict] = []
-
-        for app in explicit_apps + selected_apps:
-            _remove_game(environment, all_libraries, app, verbose=args.verbose, dry_run=dry_run)
-            status_map[app["uuid"]] = f"Removed from {environment_name} by Helios"
-            all_removed.append(app)
-
-        if all_removed:
-            all_libraries = get_all_libraries()
-            mark_helios_managed_apps(all_libraries, environment, dry_run=dry_run)
-            update_helios_cache(all_libraries, selection="all", verbose=False, dry_run=dry_run)
-
-        if status_map:
-            print("\nRemoval results:")
-            apps_for_status = [
-                all_libraries.get(uuid)
-                for uuid in status_map
-                if all_libraries.get(uuid)
-            ]
-            print_apps_with_status(apps_for_status, status_map)
-
-    # =================================================================
-    #                       COVER CLEANUP WORKFLOW
-    # =================================================================
-    if args.cleanup_covers:
-        all_libraries = get_all_libraries()
-        verify_managed_covers(
-            all_libraries,
-            environment,
-            cleanup=True,
-            verbose=True,
-            dry_run=dry_run,
-        )
-
-    # =================================================================
-    #                        STATUS / INFO WORKFLOW
-    # =================================================================
-    if args.status:
-        library = args.status.lower()
-        show_sample = args.show_sample
-
-        # Always load Steam/Epic for status
-        steam = ensure_steam_loaded()
-        epic = ensure_epic_loaded()
-
-        if library in ("apollo", "sunshine"):
-            print_library_info(
-                library,
-                steam_apps=steam,
-                epic_apps=epic,
-                environment=environment,
-                show_sample=show_sample,
-            )
-            return
-
-        if library == "steam":
-            print_library_info("steam", steam_apps=steam, show_sample=show_sample)
-            return
-
-        if library == "nonsteam":
-            print_library_info("nonsteam", steam_apps=steam, show_sample=show_sample)
-            return
-
-        if library == "epic":
-            print_library_info("epic", epic_apps=epic, show_sample=show_sample)
-            return
-
-        if library in ("helios", ""):
-            all_libs = get_all_libraries()
-            print_helios_status(steam, epic, all_libs)
-            return
-
-        print(f"Unknown library: {library}")
-        return
-
-    # =================================================================
-    #                           LIST WORKFLOW
-    # =================================================================
-    if args.list and args.add is None and args.remove is None:
-        all_libraries = get_all_libraries()
-        all_libraries = mark_helios_managed_apps(all_libraries, environment, dry_run=dry_run)
-
-        apps_to_show = list(all_libraries.values())
-
-        if args.search:
-            search_terms = [
-                term.strip().lower()
-                for part in args.search
-                for term in part.split(",")
-                if term.strip()
-            ]
-            apps_to_show = [
-                a for a in apps_to_show
-                if any(term in a.get("name", "").lower() for term in search_terms)
-            ]
-
-        if args.type:
-            type_terms = [
-                term.strip().lower()
-                for part in args.type
-                for term in part.split(",")
-                if term.strip()
-            ]
-            apps_to_show = [
-                a for a in apps_to_show
-                if any(
-                    term in str(get_helios_type(all_libraries, a["uuid"]) or "").lower()
-                    for term in type_terms
-                )
-            ]
-
-        if args.source:
-            source_terms = {
-                s.strip().lower()
-                for part in args.source
-                for s in part.split(",")
-                if s.strip()
-            }
-            apps_to_show = [
-                a for a in apps_to_show
-                if a.get("source", "").lower() in source_terms
-            ]
-
-        if args.managed is True:
-            apps_to_show = [a for a in apps_to_show if a.get("managed_by_helios")]
-        elif args.managed is False:
-            apps_to_show = [a for a in apps_to_show if not a.get("managed_by_helios")]
-
-        if not apps_to_show:
-            print("No apps found matching your filters.")
-            return
-
-        list_apps(
-            {a["uuid"]: a for a in apps_to_show},
-            sort_key=args.sort,
-        )
+    # ------------------------ Dispatch ------------------------
+    # Only the selected workflows run; each loads just the state it needs
+    selected = {
+        "cache": bool(args.cache),
+        "add": args.add is not None,
+        "remove": args.remove is not None,
+        "cleanup": args.cleanup_covers,
+        "status": bool(args.status),
+        "list": args.list and not args.status,
+    }
+    ctx = HeliosContext(args)
+    for name, handler in COMMANDS.items():
+        if selected[name]:
+            handler(ctx)
 
 
 # =====================================================================
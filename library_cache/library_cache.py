@@ -0,0 +1,131 @@
+import os
+import json
+import time
+import errno
+import pickle
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+# ----------------------------- Library Cache ----------------------------- #
+# A built library dict is pickled next to a JSON sidecar holding the mtime of
+# every input file it was built from. The pickle is only reused while all of
+# those mtimes (and the set of inputs itself) are unchanged.
+
+def input_signature(paths: Iterable[str]) -> dict[str, Optional[int]]:
+    sig = {}
+    for path in paths:
+        try:
+            sig[str(path)] = os.stat(path).st_mtime_ns
+        except OSError:
+            sig[str(path)] = None
+    return sig
+
+
+def _sidecar(cache_file: Path) -> Path:
+    return cache_file.with_suffix(".json")
+
+
+def load_cached_library(manifest_paths: list[str], cache_file: Path) -> Optional[dict]:
+    try:
+        with open(_sidecar(cache_file), "r", encoding="utf-8") as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if stored != input_signature(manifest_paths):
+        return None
+
+    try:
+        with open(cache_file, "rb") as f:
+            library = pickle.load(f)
+    except Exception:
+        return None
+
+    return library if isinstance(library, dict) else None
+
+
+def save_cached_library(manifest_paths: list[str], cache_file: Path, library: dict) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        _sidecar(cache_file).unlink(missing_ok=True)
+
+        tmp = cache_file.with_suffix(".pkl.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(library, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(cache_file)
+
+        # Sidecar last, so a half-written cache is never treated as valid
+        with open(_sidecar(cache_file), "w", encoding="utf-8") as f:
+            json.dump(input_signature(manifest_paths), f)
+    except OSError:
+        pass
+
+
+# ----------------------------- Rebuild Lock ----------------------------- #
+# Held around a library rebuild so concurrent helios runs queue up behind the
+# first one and then load its pickle instead of re-parsing the same sources.
+
+LOCK_TIMEOUT = 120.0  # seconds to wait for another run's rebuild
+
+
+def _lock(f) -> bool:
+    """
+    Take the exclusive lock. Returns False if another run still holds it
+    after LOCK_TIMEOUT; any error other than contention is raised.
+    """
+    if os.name == "nt":
+        import msvcrt
+
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            f.seek(0)
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError as e:
+                if e.errno not in (errno.EACCES, errno.EDEADLK):
+                    raise
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.1)
+    else:
+        import fcntl
+
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return True
+
+
+def _unlock(f) -> None:
+    if os.name == "nt":
+        import msvcrt
+
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def library_lock(cache_file: Path) -> Iterator[None]:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        f = open(cache_file.with_suffix(".lock"), "a+b")
+    except OSError:
+        # Cache dir not writable: rebuild without coordination
+        yield
+        return
+
+    try:
+        if not _lock(f):
+            # Give up waiting and rebuild alongside the other run
+            yield
+            return
+        try:
+            yield
+        finally:
+            _unlock(f)
+    finally:
+        f.close()
@@ -1,16 +1,15 @@
 import os
 import re
-import glob
 import struct
-import winreg
-import vdf
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from functools import lru_cache
 from typing import Dict, Optional
-import mimetypes
-from .appinfo import Appinfo
+
+# vdf, winreg and the appinfo parser are imported where they are
+# used, so importing this module stays cheap for commands that never touch Steam.
 
 # ----------------------------- Constants ----------------------------- #
 
@@ -25,6 +24,21 @@ STEAM_ASSET_PREFIXES = {
     "library_icon": None,
 }
 
+# Every (prefix, asset_type) pair, longest prefix first so that
+# "library_hero_blur" files are not claimed by "library_hero".
+ASSET_PREFIX_ORDER = sorted(
+    (
+        (prefix, asset_type)
+        for asset_type, prefixes in STEAM_ASSET_PREFIXES.items()
+        if prefixes
+        for prefix in prefixes
+    ),
+    key=lambda pair: len(pair[0]),
+    reverse=True,
+)
+
+IMAGE_EXTS = frozenset((".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"))
+
 STEAMID_OFFSET = 76561197960265728
 
 # ----------------------------- Steam Environment ----------------------------- #
@@ -36,6 +50,8 @@ class SteamEnvironment:
     @staticmethod
     @lru_cache(maxsize=1)
     def get_steam_root() -> str:
+        import winreg
+
         try:
             key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
@@ -48,6 +64,8 @@ class SteamEnvironment:
 
     @lru_cache(maxsize=1)
     def library_folders(self):
+        import vdf
+
         folders = [os.path.join(self.root, "steamapps")]
         vdf_file = os.path.join(self.root, "steamapps", "libraryfolders.vdf")
 
@@ -72,6 +90,59 @@ class SteamEnvironment:
     def librarycache(self) -> Path:
         return Path(self.root) / "appcache" / "librarycache"
 
+    def manifest_files(self) -> list[tuple[str, str]]:
+        # (appID, path) for every appmanifest_<digits>.acf in every library folder
+        manifests = []
+        for steamapps in self.library_folders():
+            try:
+                with os.scandir(steamapps) as it:
+                    for entry in it:
+                        # Case-insensitive, like the Windows glob this replaced
+                        name = entry.name.lower()
+                        if not (name.startswith("appmanifest_") and name.endswith(".acf")):
+                            continue
+                        appID = name.removeprefix("appmanifest_").removesuffix(".acf")
+                        if appID.isdigit():
+                            manifests.append((appID, entry.path))
+            except OSError:
+                continue
+        return manifests
+
+    def library_inputs(self, user: "SteamUser") -> list[str]:
+        # Every file/folder whose mtime can change the library Helios builds
+        config = os.path.join(self.root, "userdata", user.steamid32, "config")
+        librarycache = str(self.librarycache())
+
+        # Per-app asset folders: adding or replacing an image only touches these
+        try:
+            with os.scandir(librarycache) as it:
+                app_dirs = [e.path for e in it if e.is_dir()]
+        except OSError:
+            app_dirs = []
+
+        return [
+            *(path for _, path in self.manifest_files()),
+            os.path.join(self.root, "appcache", "appinfo.vdf"),
+            os.path.join(self.root, "config", "loginusers.vdf"),
+            os.path.join(config, "shortcuts.vdf"),
+            os.path.join(config, "grid"),
+            librarycache,
+            *app_dirs,
+        ]
+
+@lru_cache(maxsize=None)
+def _get_appinfo(path: Optional[str]):
+    # appinfo.vdf is tens of MB; parse it once and share it between
+    # SteamAppLibrary and SteamAssetManager
+    from .appinfo import Appinfo
+
+    return Appinfo(path)
+
+@lru_cache(maxsize=None)
+def _app_uuid(appID: str, name: str) -> str:
+    # Stable per-app UUID from appID + name
+    return str(uuid.uuid5(uuid.NAMESPACE_OID, f"{appID}|{name}")).upper()
+
 # ----------------------------- Steam User ----------------------------- #
 
 class SteamUser:
@@ -94,6 +165,8 @@ class SteamUserManager:
 
     @lru_cache(maxsize=1)
     def _login_data(self):
+        import vdf
+
         file = os.path.join(self.env.root, "config", "loginusers.vdf")
         with open(file, "r", encoding="utf-8") as f:
             return vdf.load(f)
@@ -101,61 +174,52 @@ class SteamUserManager:
     def get_users(self, all_users: bool = False) -> Dict[str, SteamUser]:
         data = self._login_data().get("users", {})
         users = {}
+        most_recent: Optional[SteamUser] = None
 
         for sid64, details in data.items():
             persona = details.get("PersonaName", "Unknown")
-            sid32 = str(int(sid64) - STEAMID_OFFSET)
-            users[persona] = SteamUser(persona, sid32)
+            user = SteamUser(persona, str(int(sid64) - STEAMID_OFFSET))
+            users[persona] = user
+            if most_recent is None and details.get("MostRecent") == "1":
+                most_recent = user
 
-        if all_users:
+        if all_users or most_recent is None:
             return users
 
-        for sid64, details in data.items():
-            if details.get("MostRecent") == "1":
-                persona = details.get("PersonaName", "Unknown")
-                sid32 = str(int(sid64) - STEAMID_OFFSET)
-                return {persona: SteamUser(persona, sid32)}
-
-        return users
+        return {most_recent.username: most_recent}
 
 # ----------------------------- Steam App Library ----------------------------- #
 
 class SteamAppLibrary:
     def __init__(self, env: SteamEnvironment):
         self.env = env
-        self.appinfo = Appinfo(env.appinfo_file())
+        self.appinfo = _get_appinfo(env.appinfo_file())
 
     def get_installed_steam_apps(self) -> Dict[str, dict]:
         apps = {}
 
-        for steamapps in self.env.library_folders():
-            for manifest in glob.glob(os.path.join(steamapps, "appmanifest_*.acf")):
-                match = re.search(r"appmanifest_(\d+)", manifest)
-                if not match:
-                    continue
-
-                appID = match.group(1)
-                try:
-                    info = self.appinfo.parsedAppInfo[int(appID)]["sections"]["appinfo"]
-                    name = info["common"]["name"]
-                    # Generate a UUID from appID + name
-                    uid_str = f"{appID}|{name}"
-                    app_uuid = str(uuid.uuid5(uuid.NAMESPACE_OID, uid_str)).upper()
-
-                    apps[app_uuid] = {
-                        "uuid": app_uuid,
-                        "appID": appID,
-                        "name": name,
-                        "source": "steam",
-                        "launch": f"steam://rungameid/{appID}",
-                        "type": info["common"].get("type"),
-                    }
-                except Exception:
-                    continue
+        for appID, _ in self.env.manifest_files():
+            try:
+                info = self.appinfo.parsedAppInfo[int(appID)]["sections"]["appinfo"]
+                name = info["common"]["name"]
+                app_uuid = _app_uuid(appID, name)
+
+                apps[app_uuid] = {
+                    "uuid": app_uuid,
+                    "appID": appID,
+                    "name": name,
+                    "source": "steam",
+                    "launch": f"steam://rungameid/{appID}",
+                    "type": info["common"].get("type"),
+                }
+            except Exception:
+                continue
 
         return apps
     
     def get_nonsteam_apps(self, user: SteamUser) -> Dict[str, dict]:
+        import vdf
+
         apps = {}
         shortcut_file = (
             Path(self.env.root)
@@ -188,9 +252,7 @@ class SteamAppLibrary:
             appID32 = struct.unpack("<I", raw_bytes)[0]
             appID64 = convert_nonsteam_id(appID32)
 
-            # Generate UUID from appID64 + name
-            uid_str = f"{appID64}|{name}"
-            app_uuid = str(uuid.uuid5(uuid.NAMESPACE_OID, uid_str)).upper()
+            app_uuid = _app_uuid(str(appID64), name)
 
             apps[app_uuid] = {
                 "uuid": app_uuid,
@@ -208,12 +270,11 @@ class SteamAppLibrary:
 class SteamAssetManager:
     def __init__(self, env: SteamEnvironment):
         self.env = env
-        self.appinfo = Appinfo(env.appinfo_file())
+        self.appinfo = _get_appinfo(env.appinfo_file())
 
     @staticmethod
-    def is_image_file(f: Path) -> bool:
-        mime_type, _ = mimetypes.guess_type(f)
-        return mime_type is not None and mime_type.startswith("image/")
+    def is_image_file(name: str) -> bool:
+        return os.path.splitext(name)[1].lower() in IMAGE_EXTS
 
     def get_steam_assets(self, appID: int) -> Dict[str, str]:
         assets: Dict[str, str] = {}
@@ -228,41 +289,66 @@ class SteamAssetManager:
             .get("common", {})
         )
 
+        # One listing of the app's cache folder; DirEntry caches is_file()
+        try:
+            with os.scandir(app_dir) as it:
+                files = {e.name: e.path for e in it if e.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            return assets
+
         # First, include assets from the appinfo JSON
         assets_full = common.get("library_assets_full", {})
         for asset_type, data in assets_full.items():
             image = data.get("image", {}).get("english")
-            if image:
-                img_path = app_dir / image
-                if img_path.exists() and self.is_image_file(img_path):
-                    assets[asset_type] = str(img_path.resolve())
-
-        if not app_dir.exists():
-            return assets
+            if not image:
+                continue
 
-        files = list(app_dir.iterdir())
+            if image in files:
+                img_path = Path(files[image])
+            elif "/" in image or "\\" in image:
+                # Nested under a subfolder, not part of the listing above
+                img_path = app_dir / image
+                if not img_path.is_file():
+                    continue
+            else:
+                continue
 
-        # Iterate over asset types and match based on prefixes
-        for asset_type, prefixes in STEAM_ASSET_PREFIXES.items():
-            if asset_type in assets:
-                continue  # already set from appinfo
+            if self.is_image_file(img_path.name):
+                assets[asset_type] = str(img_path.resolve())
 
-            if asset_type == "library_icon":
-                # Match any image file with a 40-char hex filename
-                for f in files:
-                    if ICON_RE.match(f.name) and self.is_image_file(f):
-                        assets[asset_type] = str(f)
-                        break
+        # Classify each file once; the first file seen for an asset type wins
+        for name, path in files.items():
+            if not self.is_image_file(name):
                 continue
 
-            if prefixes:
-                for f in files:
-                    if f.name.startswith(prefixes) and self.is_image_file(f):
-                        assets[asset_type] = str(f)
-                        break
+            if ICON_RE.match(name):
+                # Any image file with a 40-char hex filename
+                asset_type = "library_icon"
+            else:
+                asset_type = next(
+                    (t for prefix, t in ASSET_PREFIX_ORDER if name.startswith(prefix)),
+                    None,
+                )
+
+            if asset_type and asset_type not in assets:
+                assets[asset_type] = path
 
         return assets
 
+    def get_all_steam_assets(self, app_ids: list[int]) -> dict[int, Dict[str, str]]:
+        return self._gather(self.get_steam_assets, app_ids)
+
+    def get_all_nonsteam_assets(self, app_ids: list[str], user: SteamUser) -> dict[str, dict[str, str]]:
+        return self._gather(lambda appID64: self.get_nonsteam_assets(appID64, user), app_ids)
+
+    @staticmethod
+    def _gather(fetch, app_ids: list) -> dict:
+        # Asset lookups are filesystem-bound, so run them on a thread pool
+        if not app_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(32, len(app_ids))) as pool:
+            return dict(zip(app_ids, pool.map(fetch, app_ids)))
+
     def get_nonsteam_assets(self, appID64: str, user: SteamUser) -> dict[str, str]:
         assets = {}
         grid = Path(self.env.root) / "userdata" / user.steamid32 / "config" / "grid"
@@ -281,14 +367,15 @@ class SteamAssetManager:
         }
 
         # Iterate all files in grid folder
-        for f in grid.iterdir():
-            if not f.is_file() or not self.is_image_file(f):
-                continue  # skip non-images
-
-            name = f.stem
-            for asset_key, pattern in patterns.items():
-                # Only set the asset if not already assigned
-                if asset_key not in assets and name.startswith(pattern):
-                    assets[asset_key] = str(f)
+        with os.scandir(grid) as it:
+            for entry in it:
+                if not entry.is_file() or not self.is_image_file(entry.name):
+                    continue  # skip non-images
+
+                name = os.path.splitext(entry.name)[0]
+                for asset_key, pattern in patterns.items():
+                    # Only set the asset if not already assigned
+                    if asset_key not in assets and name.startswith(pattern):
+                        assets[asset_key] = entry.path
 
         return assets
\ No newline at end of file